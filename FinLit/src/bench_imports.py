@@ -0,0 +1,57 @@
+"""
+Import-time benchmark for the stock projection modules.
+
+Imports each module in a fresh interpreter and reports the best wall time,
+plus whether pandas/yfinance got pulled in (the runtime path must stay lean).
+
+Usage:
+    python src/bench_imports.py
+"""
+
+from __future__ import annotations
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+SRC_DIR = Path(__file__).resolve().parent
+MODULES = ("stock_runtime", "precompute_stock_prediction")
+HEAVY = ("pandas", "yfinance")
+
+
+def bench_import(module: str, repeats: int = 5) -> Tuple[float, Dict[str, bool]]:
+    """
+    Import `module` in fresh interpreters; return (best wall time in ms, {heavy_module: loaded?}).
+    """
+    code = (
+        "import sys, time; t = time.perf_counter(); "
+        f"import {module}; "
+        "ms = (time.perf_counter() - t) * 1000.0; "
+        f"print(ms, *[m in sys.modules for m in {HEAVY!r}])"
+    )
+    best = float("inf")
+    loaded = {m: False for m in HEAVY}
+    for _ in range(repeats):
+        proc = subprocess.run(
+            [sys.executable, "-c", code], cwd=str(SRC_DIR),
+            capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            sys.stderr.write(proc.stderr)
+            raise SystemExit(f"Importing {module} failed (exit code {proc.returncode}).")
+        out = proc.stdout.split()
+        best = min(best, float(out[0]))
+        for m, flag in zip(HEAVY, out[1:]):
+            loaded[m] = loaded[m] or flag == "True"
+    return best, loaded
+
+
+if __name__ == "__main__":
+    failed = []
+    for mod in MODULES:
+        ms, loaded = bench_import(mod)
+        flags = ", ".join(f"{m} imported: {v}" for m, v in loaded.items())
+        print(f"{mod}: {ms:.1f} ms ({flags})")
+        failed += [f"{mod} -> {m}" for m, v in loaded.items() if v]
+    if failed:
+        raise SystemExit("Heavy imports at import time: " + "; ".join(failed))
@@ -15,15 +15,25 @@ Why multipliers?
 Hackathon notes:
 - Uses only numpy/pandas/yfinance (no hmmlearn).
 - For speed, precompute yearly multipliers (not full monthly paths).
+- yfinance is imported lazily inside fetch_prices and pulls in pandas at fetch
+  time; pandas itself is imported here only for type checking. Serving code
+  should import the numpy-only helpers from `stock_runtime.py` instead.
 """
 
 from __future__ import annotations
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple, Sequence, Optional
+from typing import TYPE_CHECKING, Dict, List, Tuple, Sequence, Optional
 
 import numpy as np
-import pandas as pd
+
+try:  # imported as part of a package, e.g. `import src.precompute_stock_prediction`
+    from .stock_runtime import stationary_dist, summarize_percentiles, long_run_growth_and_risk
+except ImportError:  # run as a script / with src/ on sys.path
+    from stock_runtime import stationary_dist, summarize_percentiles, long_run_growth_and_risk
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # ---------------------------
@@ -177,16 +187,6 @@ def fit_gaussian_hmm_2state(
     }
 
 
-def stationary_dist(A: np.ndarray) -> np.ndarray:
-    """Compute stationary distribution w s.t. w = wA."""
-    evals, evecs = np.linalg.eig(A.T)
-    idx = int(np.argmin(np.abs(evals - 1.0)))
-    w = np.real(evecs[:, idx])
-    w = np.maximum(w, 0)
-    w = w / w.sum()
-    return w
-
-
 # ---------------------------
 # Simulation (multipliers, not prices)
 # ---------------------------
@@ -235,33 +235,6 @@ def simulate_multipliers_by_year(
     return out
 
 
-def summarize_percentiles(multipliers: np.ndarray) -> Dict[str, float]:
-    p10, p50, p90 = np.percentile(multipliers, [10, 50, 90])
-    return {"p10": float(p10), "p50": float(p50), "p90": float(p90)}
-
-
-def long_run_growth_and_risk(mu_m: np.ndarray, sigma_m: np.ndarray, A: np.ndarray) -> Tuple[float, float]:
-    """
-    Compute long-run expected annual growth (geometric) and annualized volatility (log-return space)
-    from stationary regime mixture.
-
-    Returns:
-      growth_annual (as fraction, e.g., 0.08 = 8%)
-      vol_annual (as fraction, e.g., 0.22 = 22%)
-    """
-    w = stationary_dist(A)
-    mu_bar = float(np.sum(w * mu_m))
-    # mixture variance: E[sigma^2 + (mu - E[mu])^2]
-    var_m = float(np.sum(w * (sigma_m**2 + (mu_m - mu_bar)**2)))
-
-    mu_ann_log = 12.0 * mu_bar
-    sigma_ann_log = float(np.sqrt(12.0 * var_m))
-
-    growth_annual = float(np.exp(mu_ann_log) - 1.0)  # geometric expectation
-    vol_annual = sigma_ann_log
-    return growth_annual, vol_annual
-
-
 # ---------------------------
 # Precompute pipeline
 # ---------------------------
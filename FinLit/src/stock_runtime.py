@@ -0,0 +1,107 @@
+"""
+Lightweight runtime helpers for serving precomputed stock projections.
+
+This is the lean half of `precompute_stock_prediction.py`:
+- The offline build path (yfinance download, HMM fit, simulation) lives there.
+- This module only needs numpy + json, so a worker answering portfolio/score
+  queries can start fast without pulling in pandas or yfinance.
+
+Typical use at request time:
+    payload = load_precomputed("AAPL")
+    prices = project_price_percentiles(payload, year=10, current_price=190.0)
+
+Import times of both paths can be checked with `python src/bench_imports.py`.
+"""
+
+from __future__ import annotations
+import json
+import re
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+DEFAULT_DATA_DIR = Path(__file__).resolve().parent / "data" / "precomputed"
+
+# Ticker symbols only (e.g. AAPL, BRK.B, RDS-A); keeps callers from escaping data_dir.
+_TICKER_RE = re.compile(r"[A-Z0-9.\-]{1,10}")
+
+
+# ---------------------------
+# Model math (numpy only)
+# ---------------------------
+
+def stationary_dist(A: np.ndarray) -> np.ndarray:
+    """Compute stationary distribution w s.t. w = wA."""
+    evals, evecs = np.linalg.eig(A.T)
+    idx = int(np.argmin(np.abs(evals - 1.0)))
+    w = np.real(evecs[:, idx])
+    w = np.maximum(w, 0)
+    w = w / w.sum()
+    return w
+
+
+def summarize_percentiles(multipliers: np.ndarray) -> Dict[str, float]:
+    p10, p50, p90 = np.percentile(multipliers, [10, 50, 90])
+    return {"p10": float(p10), "p50": float(p50), "p90": float(p90)}
+
+
+def long_run_growth_and_risk(mu_m: np.ndarray, sigma_m: np.ndarray, A: np.ndarray) -> Tuple[float, float]:
+    """
+    Compute long-run expected annual growth (geometric) and annualized volatility (log-return space)
+    from stationary regime mixture.
+
+    Returns:
+      growth_annual (as fraction, e.g., 0.08 = 8%)
+      vol_annual (as fraction, e.g., 0.22 = 22%)
+    """
+    w = stationary_dist(A)
+    mu_bar = float(np.sum(w * mu_m))
+    # mixture variance: E[sigma^2 + (mu - E[mu])^2]
+    var_m = float(np.sum(w * (sigma_m**2 + (mu_m - mu_bar)**2)))
+
+    mu_ann_log = 12.0 * mu_bar
+    sigma_ann_log = float(np.sqrt(12.0 * var_m))
+
+    growth_annual = float(np.exp(mu_ann_log) - 1.0)  # geometric expectation
+    vol_annual = sigma_ann_log
+    return growth_annual, vol_annual
+
+
+# ---------------------------
+# Precomputed JSON access
+# ---------------------------
+
+def load_precomputed(ticker: str, data_dir: str | Path | None = None) -> dict:
+    """
+    Read the JSON payload written by `precompute_ticker` for one ticker.
+    Raises ValueError for a malformed ticker, FileNotFoundError if the ticker
+    was never precomputed.
+    """
+    t = ticker.upper().strip()
+    if not _TICKER_RE.fullmatch(t):
+        raise ValueError(f"Invalid ticker: {ticker!r}")
+    base = Path(data_dir) if data_dir is not None else DEFAULT_DATA_DIR
+    fp = base / f"{t}.json"
+    return json.loads(fp.read_text())
+
+
+def project_price_percentiles(
+    payload: dict,
+    year: int,
+    current_price: Optional[float] = None
+) -> Dict[str, float]:
+    """
+    Turn stored multiplier percentiles into price percentiles for `year`.
+    future_price = current_price * multiplier_percentile
+
+    If current_price is not given, the payload's starting_price is used.
+    """
+    key = str(int(year))
+    mults = payload["multipliers_by_year"]
+    if key not in mults:
+        raise ValueError(f"{payload.get('ticker', '?')}: no projection for year {year} "
+                         f"(horizon is {payload.get('horizon_years')} years)")
+    price = float(payload["starting_price"] if current_price is None else current_price)
+    return {k: price * float(v) for k, v in mults[key].items()}
@@ -0,0 +1,65 @@
+"""
+Tests for the lean runtime path (stock_runtime.py).
+
+Run from FinLit/:
+    python -m pytest -q src
+"""
+
+from __future__ import annotations
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+SRC_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SRC_DIR))
+
+import stock_runtime  # noqa: E402
+
+
+def _heavy_modules_after_import(module: str) -> list:
+    code = (
+        f"import sys; import {module}; "
+        "print(' '.join(m for m in ('pandas', 'yfinance') if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=str(SRC_DIR),
+        capture_output=True, text=True
+    )
+    assert proc.returncode == 0, proc.stderr
+    return proc.stdout.split()
+
+
+@pytest.mark.parametrize("module", ["stock_runtime", "precompute_stock_prediction"])
+def test_import_does_not_load_pandas_or_yfinance(module):
+    assert _heavy_modules_after_import(module) == []
+
+
+def test_load_precomputed_reads_committed_json():
+    payload = stock_runtime.load_precomputed(" spy ")
+    assert payload["ticker"] == "SPY"
+    assert "1" in payload["multipliers_by_year"]
+
+
+def test_load_precomputed_rejects_bad_ticker():
+    for bad in ("../../etc/passwd", "AAPL/../MSFT", "", "TOOLONGTICKER"):
+        with pytest.raises(ValueError):
+            stock_runtime.load_precomputed(bad)
+
+
+def test_project_price_percentiles():
+    payload = stock_runtime.load_precomputed("SPY")
+    mults = payload["multipliers_by_year"]["10"]
+
+    prices = stock_runtime.project_price_percentiles(payload, year=10, current_price=100.0)
+    assert prices == pytest.approx({k: 100.0 * v for k, v in mults.items()})
+    assert prices["p10"] <= prices["p50"] <= prices["p90"]
+
+    default = stock_runtime.project_price_percentiles(payload, year=10)
+    assert default["p50"] == pytest.approx(payload["starting_price"] * mults["p50"])
+
+    with pytest.raises(ValueError):
+        stock_runtime.project_price_percentiles(payload, year=payload["horizon_years"] + 1)